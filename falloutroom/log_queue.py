@@ -0,0 +1,20 @@
+"""
+Queued Logging - Log output written by a background thread
+
+Request threads only put records on an in-memory queue; a QueueListener
+thread does the actual stream writes, so slow or contended stderr never
+holds up a request. Referenced from LOGGING in settings.
+"""
+import atexit
+import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
+
+def queued_stream_handler():
+    """QueueHandler whose records a listener thread writes to stderr"""
+    log_queue = queue.SimpleQueue()
+    listener = QueueListener(log_queue, logging.StreamHandler())
+    listener.start()
+    # Flush whatever is still queued when the worker exits
+    atexit.register(listener.stop)
+    return QueueHandler(log_queue)
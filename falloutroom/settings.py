@@ -1,3 +1,4 @@
+import os
 from pathlib import Path
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
@@ -63,6 +64,26 @@ DATABASES = {
     }
 }
 
+# Cache - shared by every gunicorn worker, since automation runs, AI jobs and
+# cache invalidations are written by one process and read by another.
+# The database cache works out of the box (migration 0010 creates its table);
+# set REDIS_URL (and pip install redis) to move it onto Redis
+if os.environ.get('REDIS_URL'):
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': os.environ['REDIS_URL'],
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.db.DatabaseCache',
+            'LOCATION': 'fallout_cache',
+            'OPTIONS': {'MAX_ENTRIES': 5000},
+        }
+    }
+
 # Password validation
 AUTH_PASSWORD_VALIDATORS = [
     {
@@ -134,7 +155,41 @@ REST_FRAMEWORK = {
     'DEFAULT_PAGINATION_CLASS': 'rest_framework.pagination.PageNumberPagination',
     'PAGE_SIZE': 20,
     'DEFAULT_RENDERER_CLASSES': [
-        'rest_framework.renderers.JSONRenderer',
+        'incident_response.renderers.ORJSONRenderer',
         'rest_framework.renderers.BrowsableAPIRenderer',
     ],
-}
\ No newline at end of file
+}
+
+# App logs go through a queue - a background thread does the writes
+LOGGING = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'formatters': {
+        'verbose': {
+            'format': '{asctime} {levelname} {name}: {message}',
+            'style': '{',
+        },
+    },
+    'handlers': {
+        'queued_console': {
+            '()': 'falloutroom.log_queue.queued_stream_handler',
+            'formatter': 'verbose',
+        },
+    },
+    'loggers': {
+        'incident_response': {
+            'handlers': ['queued_console'],
+            'level': 'INFO',
+            'propagate': False,
+        },
+    },
+}
+
+# OpenRouter model per AI analysis - e.g. "openai/gpt-4o-mini" for faster, cheaper replies
+AI_MODELS = {
+    'prioritization': 'openai/gpt-3.5-turbo',
+    'decision_support': 'openai/gpt-3.5-turbo',
+    'predictive': 'openai/gpt-3.5-turbo',
+    'bundle': 'openai/gpt-3.5-turbo',
+    'format_decision': 'openai/gpt-3.5-turbo',
+}
@@ -12,6 +12,14 @@ DATABASES = {
     }
 }
 
+# An in-memory database is private to each connection, so it can't hold a
+# shared cache - this single-process setup keeps the cache in memory too
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    }
+}
+
 # Allow all CORS origins
 CORS_ALLOW_ALL_ORIGINS = True
 
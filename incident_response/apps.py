@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class IncidentResponseConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'incident_response'
+
+    def ready(self):
+        # Connects the receivers that drop cached dashboard counts
+        from . import metrics  # noqa: F401
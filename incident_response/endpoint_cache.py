@@ -0,0 +1,83 @@
+"""
+Endpoint Cache - Short-lived responses for the polled dashboard views
+
+Dashboards poll these endpoints every few seconds and almost every poll
+would rebuild the same payload. cached_endpoint() serves the last
+response for its policy's TTL, and also keeps a longer-lived last-good
+copy that is served (with an X-Served-Stale header) when the view fails,
+so a database or OpenRouter outage degrades the dashboard rather than
+blanking it. Goes through the shared Django cache (see CACHES) - set
+REDIS_URL to move it onto Redis (maxmemory-policy allkeys-lfu).
+"""
+import hashlib
+from functools import wraps
+
+from django.core.cache import cache
+from django.http import HttpResponse
+from rest_framework.response import Response
+
+# policy -> (fresh seconds, last-good seconds)
+CACHE_POLICIES = {
+    'short': (5, 300),
+    'normal': (15, 900),
+    'long': (60, 3600),
+}
+
+def _snapshot(response):
+    # DRF responses keep their data so the renderer still negotiates per request
+    if isinstance(response, Response):
+        return ('data', response.data, response.status_code)
+    return ('content', response.content, response.status_code, response['Content-Type'])
+
+def _restore(entry):
+    if entry[0] == 'data':
+        return Response(entry[1], status=entry[2])
+    return HttpResponse(entry[1], status=entry[2], content_type=entry[3])
+
+def _stale(entry):
+    response = _restore(entry)
+    response['X-Served-Stale'] = 'true'
+    return response
+
+def cached_endpoint(policy='normal'):
+    """
+    Cache a GET view's response per path and query string
+
+    Goes under @api_view so DRF still renders the cached data. Only
+    successful responses are stored; an error or exception falls back to
+    the last-good copy when there is one.
+    """
+    fresh_timeout, last_good_timeout = CACHE_POLICIES[policy]
+
+    def decorator(view):
+        key_prefix = f"endpoint:{view.__module__}.{view.__name__}"
+
+        @wraps(view)
+        def wrapper(request, *args, **kwargs):
+            path_hash = hashlib.sha256(request.get_full_path().encode('utf-8')).hexdigest()
+            key = f"{key_prefix}:{path_hash}"
+            last_good_key = f"{key}:last-good"
+
+            entry = cache.get(key)
+            if entry is not None:
+                return _restore(entry)
+
+            try:
+                response = view(request, *args, **kwargs)
+            except Exception:
+                last_good = cache.get(last_good_key)
+                if last_good is None:
+                    raise
+                return _stale(last_good)
+
+            if response.status_code >= 400:
+                last_good = cache.get(last_good_key)
+                return response if last_good is None else _stale(last_good)
+
+            entry = _snapshot(response)
+            cache.set(key, entry, fresh_timeout)
+            cache.set(last_good_key, entry, last_good_timeout)
+            return response
+
+        return wrapper
+    return decorator
@@ -1,12 +1,16 @@
 import json
 import re
 import os
-import openai
 from django.core.management.base import BaseCommand
 from django.utils import timezone
 from incident_response.models import Incident, ActionPlan, Action, Deliverable
 
 
+def run(stdout=None, incident_type='security', force_new=False):
+    """In-process entry point - skips call_command's parser and command lookup"""
+    return Command(stdout=stdout).handle(incident_type=incident_type, force_new=force_new)
+
+
 def safe_json_parse(response_text):
     """
     JSON Parser with Error Recovery - The safety net for AI responses
@@ -228,11 +232,8 @@ class Command(BaseCommand):
             if not api_key.startswith('sk-or-'):
                 self.stdout.write(self.style.WARNING("⚠️ API key format may be incorrect (should start with 'sk-or-')"))
             
-            # Initialize the AI client with proper configuration
-            client = openai.OpenAI(
-                base_url="https://openrouter.ai/api/v1",
-                api_key=api_key
-            )
+            # Shared OpenRouter client - imported here so a missing key is reported above, not at import
+            from incident_response.openrouter import client
             
             self.stdout.write(self.style.SUCCESS("🔑 OpenRouter AI client initialized successfully"))
             self.stdout.write(f"   🤖 Model: {os.getenv('AI_MODEL', 'qwen/qwen3-coder:free')}")
@@ -2,6 +2,12 @@ from django.core.management.base import BaseCommand
 from incident_response.models import Incident
 from django.utils import timezone  # ✅ Use timezone-aware datetime
 
+
+def run(stdout=None, force_new=False):
+    """In-process entry point - skips call_command's parser and command lookup"""
+    return Command(stdout=stdout).handle(force_new=force_new)
+
+
 class Command(BaseCommand):
     help = 'Automatically creates a new incident for testing automation'
 
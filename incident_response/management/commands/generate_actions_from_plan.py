@@ -1,7 +1,7 @@
 import json
 import os
-import openai
 from django.core.management.base import BaseCommand
+from django.db.models import Case, F, Value, When
 from django.utils import timezone
 from incident_response.models import Incident, ActionPlan, Action, Deliverable
 
@@ -26,11 +26,13 @@ class Command(BaseCommand):
         self.stdout.write(f"Selected Plan: {action_plan.plan_name}")
         self.stdout.write("=" * 70)
         
-        # Mark plan as selected
-        ActionPlan.objects.filter(incident=action_plan.incident).update(is_selected=False)
+        # Mark plan as selected - one UPDATE, so the incident never has zero or two selected plans
+        ActionPlan.objects.filter(incident_id=action_plan.incident_id).update(
+            is_selected=Case(When(id=action_plan.id, then=Value(True)), default=Value(False)),
+            status=Case(When(id=action_plan.id, then=Value('SELECTED')), default=F('status'))
+        )
         action_plan.is_selected = True
         action_plan.status = 'SELECTED'
-        action_plan.save()
         
         # Initialize Single Adaptive AI Agent
         ai_agent = self.initialize_adaptive_ai_agent()
@@ -64,10 +66,8 @@ class Command(BaseCommand):
                 self.stdout.write(self.style.ERROR("❌ OPENROUTER_API_KEY not found"))
                 return None
             
-            client = openai.OpenAI(
-                base_url="https://openrouter.ai/api/v1",
-                api_key=api_key
-            )
+            # Shared OpenRouter client - imported here so a missing key is reported above, not at import
+            from incident_response.openrouter import client
             
             self.stdout.write(self.style.SUCCESS("🤖 Adaptive AI Agent initialized"))
             return client
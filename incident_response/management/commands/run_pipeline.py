@@ -0,0 +1,27 @@
+from django.core.management.base import BaseCommand
+
+from incident_response.management.commands import (
+    auto_create_actions_deliverables, auto_create_incidents, trigger_ai_generation
+)
+
+
+class Command(BaseCommand):
+    help = 'Run the full automation pipeline in one process: incident, action plans, adaptive AI content'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--ai-url',
+            default='http://localhost:8000/api/generate-ai-adaptive/',
+            help='Adaptive AI generation endpoint to trigger for the final step',
+        )
+
+    def handle(self, *args, **options):
+        # One interpreter and one Django setup for all three steps
+        self.stdout.write("[1/3] Starting Automated Workflow...")
+        auto_create_incidents.run(stdout=self.stdout)
+
+        self.stdout.write("[2/3] Generating Action Plans...")
+        auto_create_actions_deliverables.run(stdout=self.stdout)
+
+        self.stdout.write("[3/3] Running Adaptive AI...")
+        trigger_ai_generation.run(stdout=self.stdout, url=options['ai_url'])
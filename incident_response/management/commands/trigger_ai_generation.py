@@ -2,11 +2,23 @@ import requests
 from django.core.management.base import BaseCommand
 from django.conf import settings
 
+
+def run(stdout=None, url=None):
+    """In-process entry point - skips call_command's parser and command lookup"""
+    return Command(stdout=stdout).handle(url=url)
+
+
 class Command(BaseCommand):
     help = 'Trigger AI content generation for all GhostDraft deliverables via API'
 
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--url',
+            help='Generation endpoint to POST to (defaults to AI_GENERATION_API_URL)',
+        )
+
     def handle(self, *args, **kwargs):
-        url = getattr(settings, "AI_GENERATION_API_URL", "http://localhost:8000/api/generate-ai/")
+        url = kwargs.get('url') or getattr(settings, "AI_GENERATION_API_URL", "http://localhost:8000/api/generate-ai/")
         try:
             response = requests.post(url)
             if response.status_code == 200:
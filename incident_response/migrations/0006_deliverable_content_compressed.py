@@ -0,0 +1,33 @@
+# Generated by Django 5.2.4 on 2026-10-15 09:38
+
+import zstandard as zstd
+from django.db import migrations, models
+
+
+def compress_existing_content(apps, schema_editor):
+    Deliverable = apps.get_model('incident_response', 'Deliverable')
+    batch = []
+    for deliverable in Deliverable.objects.only('id', 'content').iterator(chunk_size=500):
+        deliverable.content_compressed = zstd.compress(deliverable.content.encode('utf-8'), 3)
+        batch.append(deliverable)
+        if len(batch) >= 500:
+            Deliverable.objects.bulk_update(batch, ['content_compressed'])
+            batch = []
+    if batch:
+        Deliverable.objects.bulk_update(batch, ['content_compressed'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('incident_response', '0005_action_estimated_hours_action_priority_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='deliverable',
+            name='content_compressed',
+            field=models.BinaryField(blank=True, null=True),
+        ),
+        migrations.RunPython(compress_existing_content, migrations.RunPython.noop),
+    ]
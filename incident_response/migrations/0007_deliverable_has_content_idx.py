@@ -0,0 +1,17 @@
+# Generated by Django 5.2.4 on 2026-10-15 09:57
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('incident_response', '0006_deliverable_content_compressed'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='deliverable',
+            index=models.Index(condition=models.Q(('content__gt', '')), fields=['id'], name='deliverable_has_content_idx'),
+        ),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 5.2.4 on 2026-10-15 10:26
+
+from django.db import migrations, models
+from django.db.models.functions import Substr
+
+
+def summarize_existing_descriptions(apps, schema_editor):
+    Action = apps.get_model('incident_response', 'Action')
+    Action.objects.update(description_summary=Substr('description', 1, 200))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('incident_response', '0007_deliverable_has_content_idx'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='action',
+            name='description_summary',
+            field=models.CharField(blank=True, default='', editable=False, max_length=200),
+        ),
+        migrations.RunPython(summarize_existing_descriptions, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 5.2.4 on 2026-10-15 10:36
+
+from django.db import migrations, models
+
+
+def flag_enhanced_deliverables(apps, schema_editor):
+    Deliverable = apps.get_model('incident_response', 'Deliverable')
+    Deliverable.objects.filter(content__icontains='AI-ENHANCED').update(is_ai_enhanced=True)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('incident_response', '0008_action_description_summary'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='deliverable',
+            name='is_ai_enhanced',
+            field=models.BooleanField(db_index=True, default=False, editable=False),
+        ),
+        migrations.RunPython(flag_enhanced_deliverables, migrations.RunPython.noop),
+    ]
@@ -1,7 +1,61 @@
 import uuid
+from datetime import timedelta
+import zstandard as zstd
 from django.db import models
 from django.utils import timezone
 
+# Prompts only ever show the start of an action's description
+DESCRIPTION_SUMMARY_LENGTH = 200
+
+# zstd level 3 - fast enough to run on every save, ~4-6x smaller for AI prose
+CONTENT_COMPRESSION_LEVEL = 3
+
+# Stamped into content by the enhance endpoint; mirrored in Deliverable.is_ai_enhanced
+AI_ENHANCED_MARKER = 'AI-ENHANCED'
+
+def is_ai_enhanced(content):
+    """Whether deliverable content carries the AI-ENHANCED marker (any case)"""
+    return AI_ENHANCED_MARKER.lower() in (content or '').lower()
+
+def compress_content(content):
+    """Compress deliverable text for storage in Deliverable.content_compressed"""
+    return zstd.compress((content or '').encode('utf-8'), CONTENT_COMPRESSION_LEVEL)
+
+# Incident age -> escalation level, checked longest first
+ESCALATION_THRESHOLDS = (
+    (timedelta(hours=24), 'C-Suite'),
+    (timedelta(hours=12), 'VP'),
+    (timedelta(hours=4), 'Manager'),
+)
+
+class IncidentQuerySet(models.QuerySet):
+    
+    def with_escalation(self):
+        """
+        Annotate the escalation inputs and level in the database
+        
+        age, total_actions, compliance_actions and completed_docs come back
+        per incident, and escalation_level applies the time thresholds -
+        any regulatory action lifts a quiet incident to Manager.
+        """
+        age = models.ExpressionWrapper(
+            models.functions.Now() - models.F('timestamp'),
+            output_field=models.DurationField()
+        )
+        return self.annotate(
+            age=age,
+            total_actions=models.Count('actions', distinct=True),
+            compliance_actions=models.Count('actions', filter=models.Q(actions__title__icontains='Regulatory'), distinct=True),
+            completed_docs=models.Count('actions__deliverables', filter=models.Q(actions__deliverables__content__gt='')),
+        ).annotate(
+            escalation_level=models.Case(
+                *(models.When(age__gt=threshold, then=models.Value(level)) for threshold, level in ESCALATION_THRESHOLDS),
+                models.When(compliance_actions__gt=0, then=models.Value('Manager')),
+                default=models.Value('None'),
+                output_field=models.CharField()
+            )
+        )
+
 class Incident(models.Model):
     title = models.CharField(max_length=200)
     description = models.TextField(blank=True, null=True)
@@ -10,6 +64,8 @@ class Incident(models.Model):
     framework_citations = models.TextField(blank=True, null=True, default='')
     status = models.CharField(max_length=50, default='PLAN_GENERATION')  # ✅ NEW
     
+    objects = IncidentQuerySet.as_manager()
+    
     class Meta:
         ordering = ['-timestamp']
     
@@ -54,32 +110,137 @@ class ActionPlan(models.Model):
     def __str__(self):
         return f"{self.plan_name} - {self.incident.title}"
 
+class ActionQuerySet(models.QuerySet):
+    """Keeps description_summary in sync for bulk writes that bypass save()"""
+    
+    def update(self, **kwargs):
+        if 'description' in kwargs:
+            kwargs['description_summary'] = models.functions.Substr(
+                models.Value(kwargs['description']) if isinstance(kwargs['description'], str) else kwargs['description'],
+                1, DESCRIPTION_SUMMARY_LENGTH
+            )
+        return super().update(**kwargs)
+    
+    def bulk_update(self, objs, fields, batch_size=None):
+        if 'description' in fields:
+            objs = list(objs)
+            for obj in objs:
+                obj.description_summary = obj.description[:DESCRIPTION_SUMMARY_LENGTH]
+            fields = [*fields, 'description_summary']
+        return super().bulk_update(objs, fields, batch_size=batch_size)
+
 class Action(models.Model):
     action_plan = models.ForeignKey(ActionPlan, on_delete=models.CASCADE, related_name='actions', null=True, blank=True)
     incident = models.ForeignKey(Incident, on_delete=models.CASCADE, related_name='actions')  # for backwards compatibility
     step = models.IntegerField()
     title = models.CharField(max_length=255)
     description = models.TextField()
+    description_summary = models.CharField(max_length=DESCRIPTION_SUMMARY_LENGTH, blank=True, default='', editable=False)
     operator = models.CharField(max_length=255)
     priority = models.CharField(max_length=20, default='Medium')
     estimated_hours = models.IntegerField(blank=True, null=True)
     ghostdraft = models.BooleanField(default=False)
     
+    objects = ActionQuerySet.as_manager()
+    
     class Meta:
         ordering = ['step']
     
     def __str__(self):
         return f"Step {self.step}: {self.title}"
+    
+    def save(self, *args, **kwargs):
+        update_fields = kwargs.get('update_fields')
+        if update_fields is None or 'description' in update_fields:
+            self.description_summary = (self.description or '')[:DESCRIPTION_SUMMARY_LENGTH]
+            if update_fields is not None:
+                kwargs['update_fields'] = {*update_fields, 'description_summary'}
+        super().save(*args, **kwargs)
+
+def _invalidate_metrics():
+    # metrics imports this module, so resolve it at call time
+    from .metrics import invalidate_metrics
+    invalidate_metrics()
+
+def _enhanced_flag(content):
+    # Plain text is checked here; SQL expressions are checked by the database
+    # against the value being written
+    if isinstance(content, str):
+        return is_ai_enhanced(content)
+    return models.lookups.IContains(content, AI_ENHANCED_MARKER)
+
+class DeliverableQuerySet(models.QuerySet):
+    """Keeps content_compressed, is_ai_enhanced and cached metrics in sync for bulk writes that bypass save()"""
+    
+    def update(self, **kwargs):
+        if 'content' in kwargs:
+            content = kwargs['content']
+            # SQL expressions can't be compressed here - readers fall back to content
+            kwargs['content_compressed'] = compress_content(content) if isinstance(content, str) else None
+            kwargs['is_ai_enhanced'] = _enhanced_flag(content)
+        rows = super().update(**kwargs)
+        if 'content' in kwargs:
+            _invalidate_metrics()
+        return rows
+    
+    def bulk_update(self, objs, fields, batch_size=None):
+        if 'content' in fields:
+            objs = list(objs)
+            for obj in objs:
+                obj.content_compressed = compress_content(obj.content) if isinstance(obj.content, str) else None
+                obj.is_ai_enhanced = _enhanced_flag(obj.content)
+            fields = [*fields, 'content_compressed', 'is_ai_enhanced']
+        rows = super().bulk_update(objs, fields, batch_size=batch_size)
+        if 'content' in fields:
+            _invalidate_metrics()
+        return rows
 
 class Deliverable(models.Model):
     action = models.ForeignKey(Action, on_delete=models.CASCADE, related_name='deliverables')
     deliverable_format = models.CharField(max_length=50, default='HTML')
     content = models.TextField(blank=True)
+    content_compressed = models.BinaryField(null=True, blank=True, editable=False)  # zstd copy of content
+    is_ai_enhanced = models.BooleanField(default=False, db_index=True, editable=False)
     export_options = models.CharField(max_length=255, blank=True, default='PDF,Email')
     voice_eligible = models.BooleanField(default=True)
     
+    objects = DeliverableQuerySet.as_manager()
+    
+    class Meta:
+        indexes = [
+            # Covers the "has AI content" counts without scanning the text column
+            models.Index(fields=['id'], condition=models.Q(content__gt=''), name='deliverable_has_content_idx'),
+        ]
+    
     def __str__(self):
         return f"Deliverable for {self.action.title}"
+    
+    def save(self, *args, **kwargs):
+        update_fields = kwargs.get('update_fields')
+        if update_fields is None or 'content' in update_fields:
+            self.content_compressed = compress_content(self.content)
+            self.is_ai_enhanced = is_ai_enhanced(self.content)
+            if update_fields is not None:
+                kwargs['update_fields'] = {*update_fields, 'content_compressed', 'is_ai_enhanced'}
+        super().save(*args, **kwargs)
+    
+    @property
+    def content_text(self):
+        """Deliverable text, read from the compressed copy when one is stored"""
+        if self.content_compressed is not None:
+            return zstd.decompress(bytes(self.content_compressed)).decode('utf-8')
+        return self.content
+
+class AIAgentStatusQuerySet(models.QuerySet):
+    
+    def with_duration(self):
+        """Annotate completed_at - started_at in the database (NULL while running)"""
+        return self.annotate(
+            duration=models.ExpressionWrapper(
+                models.F('completed_at') - models.F('started_at'),
+                output_field=models.DurationField()
+            )
+        )
 
 class AIAgentStatus(models.Model):
     incident = models.ForeignKey(Incident, on_delete=models.CASCADE)
@@ -91,6 +252,8 @@ class AIAgentStatus(models.Model):
     started_at = models.DateTimeField(auto_now_add=True)
     completed_at = models.DateTimeField(null=True, blank=True)
     
+    objects = AIAgentStatusQuerySet.as_manager()
+    
     class Meta:
         ordering = ['-started_at']
     
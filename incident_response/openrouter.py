@@ -0,0 +1,31 @@
+"""
+OpenRouter Client - One shared connection pool for every AI call
+
+Views, agents and the in-process management commands all talk to
+OpenRouter through this client, so TLS sessions and HTTP/2 connections
+are reused across requests instead of being rebuilt per call.
+"""
+import os
+
+import httpx
+from dotenv import load_dotenv
+from openai import OpenAI
+
+# Load environment variables - this is where we get our API keys
+load_dotenv()
+OPENROUTER_API_KEY = os.getenv("OPENROUTER_API_KEY")
+
+client = OpenAI(
+    base_url="https://openrouter.ai/api/v1",
+    api_key=OPENROUTER_API_KEY,
+    default_headers={
+        "HTTP-Referer": "http://localhost:8000",  # Update this for production
+        "X-Title": "FalloutRoom"
+    },
+    # HTTP/2 multiplexes the concurrent review/enhance calls over a few
+    # connections; keep every one of them alive between requests
+    http_client=httpx.Client(
+        http2=True,
+        limits=httpx.Limits(max_connections=32, max_keepalive_connections=32)
+    )
+)
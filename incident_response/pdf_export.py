@@ -0,0 +1,141 @@
+"""
+PDF Rendering - Deliverable documents as professional PDFs
+
+Nothing in here imports Django: the bulk export renders in a process pool,
+and on Windows pool workers are fresh interpreters that can't touch the ORM.
+Views flatten each deliverable into a plain dict with deliverable_pdf_payload()
+and hand that to render_deliverable_pdf().
+"""
+import hashlib
+import json
+import re
+import textwrap
+from functools import lru_cache
+from io import BytesIO
+
+from reportlab.pdfbase import pdfmetrics
+from reportlab.pdfgen import canvas
+from reportlab.lib.pagesizes import letter
+
+AI_GENERATED_MARKER = "🤖 OPENROUTER AI-GENERATED:"
+# generate_ai_with_adaptive_agent prefixes content with the expert role it used
+ADAPTIVE_AI_MARKER = re.compile(r"🤖 ADAPTIVE AI \([^)\n]*\):\n\n")
+# Character count, not points: at Helvetica 10 85 chars sits well inside the
+# 512pt text column, and per-word stringWidth() would cost more than it saves
+BODY_WRAP_WIDTH = 85
+BODY_LEADING = 12
+BODY_MARGIN = 50
+# Bump whenever rendering changes so cached PDFs from the old layout are ignored
+PDF_LAYOUT_VERSION = 2
+
+# Resolve the standard fonts once at import (and in each pool worker) rather than
+# on the first PDF
+PDF_FONTS = ("Helvetica", "Helvetica-Bold", "Helvetica-Oblique")
+for font_name in PDF_FONTS:
+    pdfmetrics.getFont(font_name)
+
+@lru_cache(maxsize=None)
+def _text_wrapper(width):
+    # textwrap.wrap() builds (and regex-compiles) a new TextWrapper per call
+    return textwrap.TextWrapper(width=width)
+
+def wrap_paragraphs(content, width=BODY_WRAP_WIDTH):
+    """Wrap content into PDF body lines, with a blank line after each paragraph"""
+    wrap = _text_wrapper(width).wrap
+    return [
+        line
+        for paragraph in content.splitlines() if paragraph.strip()
+        for line in (*wrap(paragraph), "")
+    ]
+
+def strip_ai_marker(content):
+    """Drop the leading AI provenance marker - it belongs in the app, not the PDF"""
+    content = content.removeprefix(f"{AI_GENERATED_MARKER}\n")
+    match = ADAPTIVE_AI_MARKER.match(content)
+    return content[match.end():] if match else content
+
+def _lines_per_page(start_y):
+    return int((start_y - BODY_MARGIN) // BODY_LEADING) + 1
+
+def draw_body_lines(p, lines, first_y, height):
+    """Draw wrapped body lines as one text block per page, breaking pages as they fill"""
+    # Page capacity is fixed, so slice pages up front instead of tracking y per line
+    first_page = _lines_per_page(first_y)
+    per_page = _lines_per_page(height - BODY_MARGIN)
+    pages = [lines[:first_page]]
+    pages.extend(lines[i:i + per_page] for i in range(first_page, len(lines), per_page))
+
+    for page_number, page_lines in enumerate(pages):
+        if page_number:
+            p.showPage()
+        text = p.beginText(BODY_MARGIN, first_y if page_number == 0 else height - BODY_MARGIN)
+        text.setFont("Helvetica", 10)
+        text.setLeading(BODY_LEADING)
+        text.textLines(page_lines)
+        p.drawText(text)
+
+def deliverable_pdf_payload(deliverable):
+    """Primitive fields needed to render a deliverable - cheap to pickle"""
+    action = deliverable.action
+    return {
+        'id': deliverable.id,
+        'action_title': action.title,
+        'operator': action.operator,
+        'incident_id': action.incident.id,
+        'incident_timestamp': action.incident.timestamp.strftime('%Y-%m-%d %H:%M'),
+        'content': deliverable.content_text,
+    }
+
+def pdf_digest(payload):
+    """Hash of everything drawn on the page - changes whenever the PDF would"""
+    fields = {key: value for key, value in payload.items() if key != 'id'}
+    fields['layout_version'] = PDF_LAYOUT_VERSION
+    return hashlib.sha256(json.dumps(fields, sort_keys=True).encode('utf-8')).hexdigest()
+
+def pdf_cache_key(payload, layout):
+    """Cache key for rendered PDF bytes"""
+    return f"pdf-bytes:{layout}:{pdf_digest(payload)}"
+
+def _draw_header(p, payload, width, height):
+    # Branding, action metadata and separator line
+    p.setFont("Helvetica-Bold", 20)
+    p.drawString(50, height - 50, "FALLOUT ROOM - INCIDENT RESPONSE")
+
+    p.setFont("Helvetica-Bold", 16)
+    p.drawString(50, height - 100, f"Action: {payload['action_title']}")
+
+    p.setFont("Helvetica", 12)
+    p.drawString(50, height - 130, f"Responsible: {payload['operator']}")
+    p.drawString(50, height - 150, f"Generated: {payload['incident_timestamp']}")
+
+    p.line(50, height - 170, width - 50, height - 170)
+
+def _draw_footer(p, payload, width, page_label):
+    p.setFont("Helvetica-Oblique", 8)
+    p.drawString(50, 30, f"Generated by Fallout Room - Incident ID: {payload['incident_id']}")
+    if page_label:
+        p.drawString(width - 150, 30, page_label)
+
+def render_deliverable_pdf(payload, page_label=None):
+    """
+    Render one deliverable and return the PDF bytes
+
+    Shared by the single download and the bulk export; page_label adds the
+    right-hand footer text the single download carries.
+    """
+    buffer = BytesIO()
+    p = canvas.Canvas(buffer, pagesize=letter)
+    width, height = letter
+
+    _draw_header(p, payload, width, height)
+
+    # Clean up content for professional presentation
+    content = strip_ai_marker(payload['content'])
+
+    p.setFont("Helvetica", 10)
+    draw_body_lines(p, wrap_paragraphs(content), height - 200, height)
+
+    _draw_footer(p, payload, width, page_label)
+    p.save()
+
+    return buffer.getvalue()
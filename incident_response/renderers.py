@@ -0,0 +1,26 @@
+import orjson
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+class ORJSONRenderer(JSONRenderer):
+    """
+    JSONRenderer backed by orjson - same compact UTF-8 output, several times
+    faster to encode the large AI analysis payloads
+    """
+    # Anything orjson can't encode natively goes through DRF's encoder - including
+    # datetimes, so they keep DRF's "Z" suffix for UTC
+    _fallback_encoder = JSONEncoder()
+    _options = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+
+        # Indented output (browsable API, ?indent requests) stays on the stdlib path
+        renderer_context = renderer_context or {}
+        if self.get_indent(accepted_media_type, renderer_context):
+            return super().render(data, accepted_media_type, renderer_context)
+
+        ret = orjson.dumps(data, default=self._fallback_encoder.default, option=self._options)
+        # Same as JSONRenderer: escape the line terminators that are invalid in JS string literals
+        return ret.replace(b'\xe2\x80\xa8', b'\\u2028').replace(b'\xe2\x80\xa9', b'\\u2029')
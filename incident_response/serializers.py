@@ -4,7 +4,7 @@ from .models import Incident, Action, Deliverable ,  AIAgentStatus
 class DeliverableSerializer(serializers.ModelSerializer):
     class Meta:
         model = Deliverable
-        fields = '__all__'
+        exclude = ('content_compressed',)
 
 class ActionSerializer(serializers.ModelSerializer):
     deliverables = DeliverableSerializer(many=True, read_only=True)
@@ -20,16 +20,17 @@ class IncidentSerializer(serializers.ModelSerializer):
         model = Incident
         fields = '__all__'
 
+class DurationSecondsField(serializers.ReadOnlyField):
+    """Renders a timedelta as whole seconds"""
+    
+    def to_representation(self, value):
+        return int(value.total_seconds())
+
 class AIAgentStatusSerializer(serializers.ModelSerializer):
-    duration = serializers.SerializerMethodField()
+    # Expects AIAgentStatus.objects.with_duration() - computed by the database
+    duration = DurationSecondsField()
     incident_title = serializers.CharField(source='incident.title', read_only=True)
     
     class Meta:
         model = AIAgentStatus
         fields = '__all__'
-    
-    def get_duration(self, obj):
-        if obj.completed_at and obj.started_at:
-            delta = obj.completed_at - obj.started_at
-            return int(delta.total_seconds())
-        return None
@@ -20,12 +20,17 @@ urlpatterns = [
     path('save-document/<int:deliverable_id>/', views.save_document_content, name='save_document'),
     path('generate-ai-adaptive/', views.generate_ai_with_adaptive_agent, name='generate-ai-adaptive'),
     path('scheduled-automation/', views.trigger_scheduled_automation_enhanced, name='scheduled_automation'),   
+    path('frontend-automation/', views.trigger_frontend_automation, name='frontend_automation'),
+    path('automation-status/<str:automation_id>/', views.automation_status, name='automation_status'),
     path('ai-document-review/', views.ai_document_review, name='ai_document_review'),
     path('auto-enhance-documents/', views.auto_enhance_documents, name='auto_enhance_documents'),
     path('ai-action-prioritization/', views.ai_action_prioritization, name='ai_action_prioritization'),
     # path('optimize-workflow/', views.optimize_workflow, name='optimize_workflow'),
     path('ai-decision-support/', views.ai_decision_support, name='ai_decision_support'),
     path('predictive-analytics/', views.predictive_analytics, name='predictive_analytics'),
+    path('ai-analysis-bundle/', views.ai_analysis_bundle, name='ai_analysis_bundle'),
+    path('ai-analysis-stream/<str:analysis>/', views.ai_analysis_stream, name='ai_analysis_stream'),
+    path('ai-jobs/<str:job_id>/', views.ai_job_status, name='ai_job_status'),
     path('escalation-triggers/', views.automated_escalation_triggers, name='escalation_triggers'),
     path('real-time-metrics/', views.real_time_metrics, name='real_time_metrics'),
     path('system-health/', views.system_health_check, name='system_health'),